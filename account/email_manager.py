@@ -1,16 +1,65 @@
-from django.template.loader import render_to_string
-from django.utils.crypto import get_random_string
-from django.core.mail import EmailMessage
-from django.db import transaction
+from django.core.mail import EmailMessage, get_connection
 from django.utils import timezone
 from django.conf import settings
 from django.core.cache import cache
-from typing import Any, Dict, Optional
-import environ, logging
+from typing import Any, Dict, List, Optional, Tuple
+from .tasks import send_email_task
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache, wraps
+from html import escape
+from string import Template
+import hashlib, logging, secrets, time
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _get_template(template_path: str) -> Template:
+    """
+    Load an email template once per process.
+
+    Email templates only substitute a handful of values, so they are plain
+    string.Template files rather than django templates.
+    """
+    with open(settings.BASE_DIR / 'templates' / template_path, encoding='utf-8') as template_file:
+        return Template(template_file.read())
+
+
+_current_year = timezone.now().year
+_next_year_starts_at = datetime(_current_year + 1, 1, 1, tzinfo=dt_timezone.utc).timestamp()
+
+
+def _get_current_year() -> int:
+    """Return the current year, only recomputing it once the year rolls over"""
+    global _current_year, _next_year_starts_at
+    if time.time() >= _next_year_starts_at:
+        _current_year = timezone.now().year
+        _next_year_starts_at = datetime(_current_year + 1, 1, 1, tzinfo=dt_timezone.utc).timestamp()
+    return _current_year
+
+
+def token_cache_key(token: str) -> str:
+    """
+    Return the cache key a user token is stored under.
+
+    Only the SHA-256 digest of the token is kept so that the raw tokens sent
+    out in emails never sit in the cache.
+    """
+    return f'user_token:{hashlib.sha256(token.encode()).hexdigest()}'
+
+
+def _log_and_reraise(func):
+    """Log the traceback of a failed user email operation before re-raising it"""
+    @wraps(func)
+    def wrapper(self, user, *args, **kwargs):
+        try:
+            return func(self, user, *args, **kwargs)
+        except Exception:
+            logger.exception('%s failed for user %s', func.__name__, user.id)
+            raise
+    return wrapper
+
+
 class EmailManager:
     """
     Handles email operations including token generation, email rendering and sending.
@@ -20,7 +69,7 @@ class EmailManager:
     """
 
     def __init__(self):
-        self.env = environ.Env()
+        self.client_url = settings.CLIENT_URL
         self.from_email = settings.DEFAULT_FROM_EMAIL
         self.token_expiry = timezone.timedelta(minutes=15)
     
@@ -35,13 +84,31 @@ class EmailManager:
         Returns:
             str: Generated token
         """
-        try:
-            token = get_random_string(length=64)
-            cache.set(token, user.id, timeout=(expiry or self.token_expiry).seconds)
-            return token
-        except Exception as e:
-            logger.error(f"Token generation failed for user {user.id}: {str(e)}")
-            raise
+        token = secrets.token_urlsafe(48)
+        cache.set(token_cache_key(token), user.id, timeout=(expiry or self.token_expiry).seconds)
+        return token
+
+    def generate_user_tokens_bulk(
+        self,
+        users,
+        expiry: Optional[timezone.timedelta] = None
+    ) -> List[Tuple[Any, str]]:
+        """
+        Generate verification tokens for several users with a single cache write.
+
+        Args:
+            users: The user objects to generate tokens for
+            expiry: Optional custom expiration time delta
+
+        Returns:
+            List[Tuple[Any, str]]: (user, token) pairs
+        """
+        user_tokens = [(user, secrets.token_urlsafe(48)) for user in users]
+        cache.set_many(
+            {token_cache_key(token): user.id for user, token in user_tokens},
+            timeout=(expiry or self.token_expiry).seconds
+        )
+        return user_tokens
     
     def send_email(
         self,
@@ -60,98 +127,146 @@ class EmailManager:
             to_email: Recipient email address
             
         Raises:
-            TemplateDoesNotExist: If template is not found
+            FileNotFoundError: If template is not found
+            KeyError: If the context is missing a template placeholder
             SMTPException: If email sending fails
         """
+        email = self.build_email(template_path, context, subject, to_email)
+        email.send(fail_silently=False)
+        logger.info("Email sent successfully to %s", to_email)
+
+    def build_email(
+        self,
+        template_path: str,
+        context: Dict[str, Any],
+        subject: str,
+        to_email: str
+    ) -> EmailMessage:
+        """
+        Render a template into an HTML email message without sending it.
+
+        Args:
+            template_path: Path to the email template
+            context: Template context dictionary
+            subject: Email subject
+            to_email: Recipient email address
+
+        Returns:
+            EmailMessage: The rendered email message
+        """
+        email_body = _get_template(template_path).substitute(
+            {key: escape(str(value)) for key, value in context.items()}
+        )
+        email = EmailMessage(
+            subject=subject,
+            body=email_body,
+            from_email=self.from_email,
+            to=[to_email]
+        )
+        email.content_subtype = 'html'
+        return email
+
+    def send_emails_batch(self, messages: List[EmailMessage]) -> List[EmailMessage]:
+        """
+        Send several emails over a single connection from the email backend.
+
+        With the pooled SMTP backend this checks out one warm connection for the
+        whole batch instead of one per message. Failures are handled per message so that one bad recipient does not
+        prevent the rest of the batch from being delivered.
+
+        Args:
+            messages: Email messages to send
+
+        Returns:
+            List[EmailMessage]: Messages that could not be sent
+        """
+        failed = []
+        connection = get_connection()
         try:
-            email_body = render_to_string(template_path, context)
-            email = EmailMessage(
-                subject=subject,
-                body=email_body,
-                from_email=self.from_email,
-                to=[to_email]
-            )
-            email.content_subtype = 'html'
-            email.send(fail_silently=False)
-            logger.info(f"Email sent successfully to {to_email}")
+            connection.open()
         except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            raise
+            # nothing in the batch can go out, so hand every message back for a retry
+            logger.error("Failed to open connection for a batch of %s emails: %s", len(messages), e)
+            return list(messages)
+
+        try:
+            for message in messages:
+                message.connection = connection
+                try:
+                    message.send(fail_silently=False)
+                    logger.info("Email sent successfully to %s", ', '.join(message.to))
+                except Exception as e:
+                    logger.error("Failed to send email to %s: %s", ', '.join(message.to), e)
+                    failed.append(message)
+        finally:
+            connection.close()
+        return failed
 
-    @transaction.atomic
+    @_log_and_reraise
     def send_activation_email(self, user) -> None:
         """
-        Send account activation email to user.
+        Queue an account activation email for the user.
         
         Args:
             user: User object to send activation email to
             
         Raises:
-            Exception: If email sending fails
+            Exception: If the email could not be queued
         """
-        try:
-            token = self.generate_user_token(user)
-            confirmation_url = (
-                f'{self.env("CLIENT_URL")}/verify-token'
-                f'?token={token}'
-            )
-            
-            context = {
-                'user': user,
-                'confirmation_url': confirmation_url,
-                'year': timezone.now().year
-            }
-            
-            self.send_email(
-                template_path='email_confirmation.html',
-                context=context,
-                subject='Activate Your Checkmate Account',
-                to_email=user.email
-            )
-
-            logger.info(f'Confirmation url: {confirmation_url}')
-        except Exception as e:
-            logger.error(f"Activation email failed for user {user.id}: {str(e)}")
-            raise
+        token = self.generate_user_token(user)
+        confirmation_url = (
+            f'{self.client_url}/verify-token'
+            f'?token={token}'
+        )
+
+        context = {
+            'first_name': user.first_name,
+            'confirmation_url': confirmation_url,
+            'year': _get_current_year()
+        }
 
-    @transaction.atomic
+        send_email_task.delay(
+            template_path='email_confirmation.html',
+            context=context,
+            subject='Activate Your Checkmate Account',
+            to_email=user.email
+        )
+
+        logger.debug('Confirmation url: %s', confirmation_url)
+
+    @_log_and_reraise
     def send_password_reset_email(self, user) -> None:
         """
-        Send password reset email to user.
+        Queue a password reset email for the user.
         
         Args:
             user: User object to send password reset email to
             
         Raises:
-            Exception: If email sending fails
+            Exception: If the email could not be queued
         """
-        try:
-            token = self.generate_user_token(
-                user,
-                expiry=timezone.timedelta(hours=1)
-            )
-            password_reset_url = (
-                f'{self.env("CLIENT_URL")}/change-password'
-                f'?token={token}'
-            )
-            
-            context = {
-                'user': user,
-                'password_reset_url': password_reset_url,
-                'year': timezone.now().year
-            }
-            
-            self.send_email(
-                template_path='password_reset.html',
-                context=context,
-                subject='Reset your Checkmate password',
-                to_email=user.email
-            )
+        token = self.generate_user_token(
+            user,
+            expiry=timezone.timedelta(hours=1)
+        )
+        password_reset_url = (
+            f'{self.client_url}/change-password'
+            f'?token={token}'
+        )
 
-            logger.info(f'Password reset url: {password_reset_url}')
+        context = {
+            'first_name': user.first_name,
+            'password_reset_url': password_reset_url,
+            'year': _get_current_year()
+        }
 
-        except Exception as e:
-            logger.error(f"Password reset email failed for user {user.id}: {str(e)}")
-            raise
+        send_email_task.delay(
+            template_path='password_reset.html',
+            context=context,
+            subject='Reset your Checkmate password',
+            to_email=user.email
+        )
+
+        logger.debug('Password reset url: %s', password_reset_url)
 
 email_manager = EmailManager()
\ No newline at end of file
@@ -3,6 +3,7 @@ from django.db import transaction
 from .models import CustomUser, Lecturer, Student
 from django.core.cache import cache
 from django.contrib.auth import authenticate
+from .email_manager import token_cache_key
 import re
 
 
@@ -95,7 +96,7 @@ class ActivateAccountSerializer(serializers.Serializer):
     def validate(self, data):
         try:
             # Check if the token is valid by validating if it's still in cache 
-            user_id = cache.get(data['token'])
+            user_id = cache.get(token_cache_key(data['token']))
             if not user_id:
                 raise serializers.ValidationError('Token is invalid or expired')
             
@@ -121,7 +122,7 @@ class ResetPasswordSerializer(serializers.Serializer):
         return password
     
     def validate_token(self, token):
-        user_id = cache.get(token)
+        user_id = cache.get(token_cache_key(token))
         if not user_id:
             raise serializers.ValidationError('Invalid token')
         return user_id
@@ -0,0 +1,57 @@
+from celery import shared_task
+from smtplib import SMTPException
+from typing import Any, Dict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, autoretry_for=(SMTPException,), retry_backoff=True, max_retries=5)
+def send_email_task(self, template_path: str, context: Dict[str, Any], subject: str, to_email: str) -> None:
+    """
+    Render and send a templated email from a celery worker.
+
+    The context must be JSON serializable since it travels through the broker,
+    so model instances should be reduced to plain dictionaries before queueing.
+    Failures are only logged once the task gives up, not on every retry.
+    """
+    from .email_manager import email_manager
+
+    try:
+        email_manager.send_email(
+            template_path=template_path,
+            context=context,
+            subject=subject,
+            to_email=to_email
+        )
+    except Exception as e:
+        if not isinstance(e, SMTPException) or self.request.retries >= self.max_retries:
+            logger.exception('Failed to send email to %s', to_email)
+        raise
+
+
+@shared_task
+def send_email_batch_task(emails: List[Dict[str, Any]]) -> None:
+    """
+    Send a batch of templated emails from a celery worker over one SMTP connection.
+
+    Each item holds the keyword arguments accepted by send_email_task. Emails
+    that fail to send are requeued individually so they get retried with
+    backoff without resending the ones that were delivered. Emails that can't
+    be rendered are logged and dropped since retrying them would fail again.
+    """
+    from .email_manager import email_manager
+
+    messages = []
+    email_lookup = {}
+    for email in emails:
+        try:
+            message = email_manager.build_email(**email)
+        except Exception:
+            logger.exception('Failed to build email to %s', email.get('to_email'))
+            continue
+        messages.append(message)
+        email_lookup[id(message)] = email
+
+    for message in email_manager.send_emails_batch(messages):
+        send_email_task.delay(**email_lookup[id(message)])
@@ -1,8 +1,17 @@
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
+from django.test import SimpleTestCase
+from django.core import mail
+from django.core.mail.backends import locmem
 from .models import Student, Lecturer, CustomUser
+from .email_manager import email_manager, token_cache_key
+from .serializers import ActivateAccountSerializer
+from .tasks import send_email_batch_task, send_email_task
+from celery.exceptions import Retry
 from unittest.mock import patch
+import smtplib
+from django.core.cache import cache
 
 class AccountTests(APITestCase):
     """
@@ -151,3 +160,153 @@ class AccountTests(APITestCase):
         url = reverse('send-activation-token')
         response = self.client.post(url, {'email': 'notfound@example.com'}, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_activation_email_is_queued(self):
+        """Ensure the activation email is handed off to celery with a serializable context"""
+        user = CustomUser.objects.create_user(
+            email='queued@example.com',
+            first_name='queued',
+            last_name='user',
+            password='@Securepassword123',
+            department='Computer Science'
+        )
+
+        with patch('account.email_manager.EmailManager.generate_user_token', return_value='token'), \
+             patch('account.email_manager.send_email_task') as mock_send_email_task:
+            email_manager.send_activation_email(user)
+
+            mock_send_email_task.delay.assert_called_once()
+            kwargs = mock_send_email_task.delay.call_args.kwargs
+            self.assertEqual(kwargs['to_email'], user.email)
+            self.assertEqual(kwargs['context']['first_name'], user.first_name)
+
+    def test_email_template_escapes_context(self):
+        """Ensure values substituted into email templates are html escaped"""
+        email = email_manager.build_email(
+            template_path='email_confirmation.html',
+            context={'first_name': '<b>john</b>', 'confirmation_url': 'http://example.com/?a=1&b=2', 'year': 2026},
+            subject='Activate Your Checkmate Account',
+            to_email='john@example.com'
+        )
+
+        self.assertIn('Hello, &lt;b&gt;john&lt;/b&gt;!', email.body)
+        self.assertIn('href="http://example.com/?a=1&amp;b=2"', email.body)
+        self.assertIn('&copy; 2026 Checkmate', email.body)
+
+    def test_activate_account_with_hashed_token(self):
+        """Ensure tokens are cached under their hash and can still activate an account"""
+        user = CustomUser.objects.create_user(
+            email='hashed@example.com',
+            first_name='hashed',
+            last_name='user',
+            password='@Securepassword123',
+            department='Computer Science'
+        )
+
+        token = email_manager.generate_user_token(user)
+        self.assertIsNone(cache.get(token))
+
+        url = f"{reverse('activate-account')}?token={token}"
+        response = self.client.patch(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertTrue(user.email_verified)
+
+    def test_bulk_tokens_are_written_once_and_activate_accounts(self):
+        """Ensure bulk tokens are cached under their hash in one write and validate like single tokens"""
+        users = [
+            CustomUser.objects.create_user(
+                email=f'bulk{index}@example.com',
+                first_name='bulk',
+                last_name='user',
+                password='@Securepassword123',
+                department='Computer Science'
+            )
+            for index in range(2)
+        ]
+
+        with patch('account.email_manager.cache.set_many', wraps=cache.set_many) as mock_set_many:
+            user_tokens = email_manager.generate_user_tokens_bulk(users)
+
+        mock_set_many.assert_called_once()
+        mapping = mock_set_many.call_args.args[0]
+        self.assertEqual(mapping, {token_cache_key(token): user.id for user, token in user_tokens})
+        self.assertTrue(all(key.startswith('user_token:') for key in mapping))
+        self.assertEqual(mock_set_many.call_args.kwargs['timeout'], email_manager.token_expiry.seconds)
+
+        for user, token in user_tokens:
+            serializer = ActivateAccountSerializer(data={'token': token})
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(serializer.validated_data['user'], user)
+
+class EmailBatchTests(SimpleTestCase):
+    """
+    Test suite for sending emails in batches
+    """
+
+    def _email(self, to_email, **context):
+        return {
+            'template_path': 'email_confirmation.html',
+            'context': {'first_name': 'john', 'confirmation_url': 'http://example.com', 'year': 2026, **context},
+            'subject': 'Activate Your Checkmate Account',
+            'to_email': to_email
+        }
+
+    def test_failed_email_does_not_stop_batch(self):
+        """Ensure one failing email is requeued on its own while the rest of the batch is delivered"""
+        emails = [
+            self._email('first@example.com'),
+            self._email('refused@example.com'),
+            self._email('second@example.com'),
+        ]
+        # missing placeholders make the template fail to render
+        broken_email = self._email('broken@example.com')
+        del broken_email['context']['confirmation_url']
+        emails.append(broken_email)
+
+        send_messages = locmem.EmailBackend.send_messages
+
+        def refuse_recipient(backend, messages):
+            if 'refused@example.com' in messages[0].to:
+                raise smtplib.SMTPRecipientsRefused({'refused@example.com': (550, b'No such user')})
+            return send_messages(backend, messages)
+
+        with patch.object(locmem.EmailBackend, 'send_messages', autospec=True, side_effect=refuse_recipient), \
+             patch('account.tasks.send_email_task') as mock_send_email_task:
+            send_email_batch_task(emails)
+
+        self.assertEqual([message.to for message in mail.outbox], [['first@example.com'], ['second@example.com']])
+        mock_send_email_task.delay.assert_called_once_with(**emails[1])
+
+    def test_batch_is_requeued_when_connection_fails(self):
+        """Ensure every email in a batch is requeued when no SMTP connection can be opened"""
+        emails = [self._email('first@example.com'), self._email('second@example.com')]
+
+        with patch.object(locmem.EmailBackend, 'open', side_effect=smtplib.SMTPServerDisconnected()), \
+             patch('account.tasks.send_email_task') as mock_send_email_task:
+            send_email_batch_task(emails)
+
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(mock_send_email_task.delay.call_count, 2)
+        mock_send_email_task.delay.assert_any_call(**emails[0])
+        mock_send_email_task.delay.assert_any_call(**emails[1])
+
+    def test_email_failure_is_logged_once_retries_run_out(self):
+        """Ensure a failing email is only logged with its recipient on the final attempt"""
+        email = self._email('refused@example.com')
+        error = smtplib.SMTPRecipientsRefused({'refused@example.com': (550, b'No such user')})
+
+        with patch('account.email_manager.EmailManager.send_email', side_effect=error), \
+             self.assertLogs('account.tasks', level='ERROR') as logs:
+            send_email_task.apply(kwargs=email, retries=send_email_task.max_retries)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('refused@example.com', logs.output[0])
+
+        with patch('account.email_manager.EmailManager.send_email', side_effect=error), \
+             patch('account.tasks.logger') as mock_logger, \
+             patch.object(send_email_task, 'retry', side_effect=Retry()):
+            send_email_task.apply(kwargs=email, retries=0)
+
+        mock_logger.exception.assert_not_called()
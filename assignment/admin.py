@@ -3,6 +3,14 @@ from .models import Assignment, TestCase, Submission, Feedback
 
 # Register your models here.
 admin.site.register(Assignment)
-admin.site.register(TestCase)
-admin.site.register(Submission)
-admin.site.register(Feedback)
\ No newline at end of file
+admin.site.register(Feedback)
+
+
+@admin.register(TestCase)
+class TestCaseAdmin(admin.ModelAdmin):
+    list_select_related = ('assignment',)
+
+
+@admin.register(Submission)
+class SubmissionAdmin(admin.ModelAdmin):
+    list_select_related = ('assignment', 'student')
@@ -5,7 +5,8 @@ from .models import Assignment
 
 class AssignmentFilter(filters.FilterSet):
     is_draft = filters.BooleanFilter()
+    language_id = filters.NumberFilter()
 
     class Meta:
         model = Assignment
-        fields = ['is_draft']
+        fields = ['is_draft', 'language_id']
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-14 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignment', '0005_delete_exampletestcase'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['assignment', 'submitted_at'], name='assignment__assignm_257b71_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testcase',
+            index=models.Index(fields=['assignment', 'is_hidden'], name='assignment__assignm_63aa6b_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-14 09:30
+
+import django.db.models.deletion
+import gzip
+from django.db import migrations, models
+
+
+def move_code_to_blob(apps, schema_editor):
+    Submission = apps.get_model('assignment', 'Submission')
+    SubmissionBlob = apps.get_model('assignment', 'SubmissionBlob')
+
+    SubmissionBlob.objects.bulk_create(
+        (
+            SubmissionBlob(submission_id=submission.id, code_gz=gzip.compress(submission.code.encode()))
+            for submission in Submission.objects.only('id', 'code').iterator()
+        ),
+        batch_size=500
+    )
+
+
+def move_code_from_blob(apps, schema_editor):
+    Submission = apps.get_model('assignment', 'Submission')
+    SubmissionBlob = apps.get_model('assignment', 'SubmissionBlob')
+
+    for blob in SubmissionBlob.objects.iterator():
+        Submission.objects.filter(pk=blob.submission_id).update(
+            code=gzip.decompress(blob.code_gz).decode()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignment', '0006_submission_assignment_submitted_at_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionBlob',
+            fields=[
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='blob', serialize=False, to='assignment.submission')),
+                ('code_gz', models.BinaryField()),
+            ],
+        ),
+        migrations.RunPython(move_code_to_blob, move_code_from_blob),
+        # gives the column a default so that reversing the RemoveField below can
+        # re-add it as NOT NULL on a table that already has rows
+        migrations.AlterField(
+            model_name='submission',
+            name='code',
+            field=models.TextField(default=''),
+        ),
+        migrations.RemoveField(
+            model_name='submission',
+            name='code',
+        ),
+    ]
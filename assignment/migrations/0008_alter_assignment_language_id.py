@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-14 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignment', '0007_submissionblob_remove_submission_code'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='assignment',
+            name='language_id',
+            field=models.IntegerField(db_index=True),
+        ),
+    ]
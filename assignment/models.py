@@ -3,7 +3,7 @@ from course_management.models import Course
 from account.models import CustomUser
 from django.db import transaction
 from django.core.validators import MaxValueValidator, MinValueValidator
-import uuid
+import gzip, uuid
 
 
 class Assignment(models.Model):
@@ -16,7 +16,7 @@ class Assignment(models.Model):
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
     max_score = models.IntegerField(validators=[MinValueValidator(1), MaxValueValidator(100)])
     programming_language = models.CharField(null=True)
-    language_id = models.IntegerField()
+    language_id = models.IntegerField(db_index=True)
     is_draft = models.BooleanField(default=True)
 
     def __str__(self):
@@ -26,6 +26,11 @@ class Assignment(models.Model):
         ordering = ['created_at']
 
 
+class TestCaseManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('assignment')
+
+
 class TestCase(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, related_name='test_cases')
@@ -33,37 +38,68 @@ class TestCase(models.Model):
     output = models.CharField(max_length=100)
     is_hidden = models.BooleanField(default=False)
 
+    objects = TestCaseManager()
+
     def __str__(self):
         return f'{self.assignment.title} - {self.input}'
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['assignment', 'is_hidden'])
+        ]
+
+
+class SubmissionManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('assignment', 'student')
+
 
 class Submission(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE)
     student = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
-    code = models.TextField()
     score = models.FloatField()
     is_best = models.BooleanField(default=False)
     results = models.JSONField()
     submitted_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SubmissionManager()
+
     def __str__(self):
         return f'{self.assignment.title} - {self.student.email}'
 
+    @property
+    def code(self):
+        # the code is kept compressed in SubmissionBlob so that submission rows stay small,
+        # use select_related('blob') on querysets that need it
+        if getattr(self, '_code', None) is None:
+            self._code = gzip.decompress(self.blob.code_gz).decode()
+        return self._code
+
+    @code.setter
+    def code(self, value):
+        self._code = value
+        self._code_changed = True
+
     class Meta:
         ordering = ['-submitted_at']
         indexes = [
             models.Index(fields=['assignment', 'student', 'is_best']),
-            models.Index(fields=['student', 'assignment'])
+            models.Index(fields=['student', 'assignment']),
+            models.Index(fields=['assignment', 'submitted_at'])
         ]
     
     def save(self, *args, **kwargs):
+        if self._state.adding and getattr(self, '_code', None) is None:
+            # every submission gets a blob so that reading code never fails
+            self.code = ''
+
         with transaction.atomic():
             previous_best_submission = Submission.objects.filter(
                 assignment=self.assignment,
                 student=self.student,
                 is_best=True
-            ).select_for_update().first()
+            ).select_for_update(of=('self',)).first()
 
             if not previous_best_submission or self.score >= previous_best_submission.score:
                 Submission.objects.filter(
@@ -74,7 +110,19 @@ class Submission(models.Model):
                 self.is_best = True
             else:
                 self.is_best = False
-        super().save(*args, **kwargs)
+            super().save(*args, **kwargs)
+
+            if getattr(self, '_code_changed', False):
+                SubmissionBlob.objects.update_or_create(
+                    submission=self,
+                    defaults={'code_gz': gzip.compress(self._code.encode())}
+                )
+                self._code_changed = False
+
+
+class SubmissionBlob(models.Model):
+    submission = models.OneToOneField(Submission, on_delete=models.CASCADE, primary_key=True, related_name='blob')
+    code_gz = models.BinaryField()
 
 
 class Feedback(models.Model):
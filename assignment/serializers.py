@@ -96,12 +96,13 @@ class AssignmentSubmissionSerializer(serializers.Serializer):
 class SubmissionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Submission
-        fields = ['id', 'code', 'score', 'is_best', 'submitted_at']
+        fields = ['id', 'score', 'is_best', 'submitted_at']
 
 
 class SubmissionDetailSerializer(serializers.ModelSerializer):
     assignment = AssignmentSerializer()
     student = serializers.StringRelatedField()
+    code = serializers.CharField(read_only=True)
 
     class Meta:
         model = Submission
@@ -122,7 +123,7 @@ class AssignmentResultDataSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Submission
-        fields = ['score', 'code', 'submitted_at', 'student']
+        fields = ['id', 'score', 'code', 'submitted_at', 'student']
 
 
 class FeedbackRatingSerializer(serializers.ModelSerializer):
@@ -139,12 +140,11 @@ class FeedbackRatingSerializer(serializers.ModelSerializer):
 
 
 class FeedbackListSerializer(serializers.ModelSerializer):
-    code = serializers.CharField(source='submission.code')
     score = serializers.CharField(source='submission.score')
 
     class Meta:
         model = Feedback
-        fields = ['id', 'content', 'rating', 'code', 'score']
+        fields = ['id', 'content', 'rating', 'submission', 'score']
         ordering = ['-created_at']
 
 
@@ -21,10 +21,13 @@ class CodeExecutionService:
         """Perform batch submission to Judge0"""
         try:
             url = f"{self.BASE_URL}/submissions/batch?base64_encoded=true"
+
+            # the source code is the same for every test case so it only needs encoding once
+            encoded_source_code = base64.b64encode(source_code.encode()).decode()
             payload = {
                 "submissions": [
                     {
-                        "source_code": base64.b64encode(source_code.encode()).decode(),
+                        "source_code": encoded_source_code,
                         "language_id": language_id,
                         "stdin": base64.b64encode(tc["input"].encode()).decode(),
                         "expected_output": base64.b64encode(tc["output"].encode()).decode()
@@ -36,7 +39,7 @@ class CodeExecutionService:
             response = requests.post(url, headers=self.headers, json=payload)
             return response.json()
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error submitting code to Judge0: {str(e)}")
+            logger.error("Error submitting code to Judge0: %s", e)
             raise
 
     def get_submission_result(self, tokens: List[Dict[str, str]]) -> dict:
@@ -55,7 +58,7 @@ class CodeExecutionService:
                 })
             return {"submission_result": cleaned_submissions}
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting submission result: {str(e)}")
+            logger.error("Error getting submission result: %s", e)
             raise
     
     def get_available_languages(self) -> dict:
@@ -74,7 +77,7 @@ class CodeExecutionService:
             return languages
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting available languages: {str(e)}")
+            logger.error("Error getting available languages: %s", e)
             raise
 
     def validate_language(self, language_id) -> bool:
@@ -85,7 +88,7 @@ class CodeExecutionService:
                 return True
             return False
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting available languages: {str(e)}")
+            logger.error("Error getting available languages: %s", e)
             raise
 
 code_execution_service = CodeExecutionService()
\ No newline at end of file
@@ -4,7 +4,8 @@ from rest_framework.test import APITestCase
 from rest_framework import status
 from unittest.mock import Mock, patch
 from django.contrib.auth import get_user_model
-from .models import Assignment, Course, Submission, TestCase
+from .models import Assignment, Course, Submission, SubmissionBlob, TestCase
+import gzip
 
 User = get_user_model()
 
@@ -328,3 +329,24 @@ class AssignmentViewsTest(APITestCase):
 
         # Check that the new submission is the best
         self.assertTrue(Submission.objects.get(pk=new_submission.id).is_best)
+
+    def test_submission_code_is_stored_compressed(self):
+        """Test that submission code is kept compressed in its own table and read back intact"""
+        blob = SubmissionBlob.objects.get(submission=self.submission)
+        self.assertEqual(gzip.decompress(blob.code_gz).decode(), 'def solution(): return "Hello"')
+
+        submission = Submission.objects.select_related('blob').get(pk=self.submission.id)
+        self.assertEqual(submission.code, 'def solution(): return "Hello"')
+
+    def test_submission_without_code_reads_empty_code(self):
+        """Test that a submission saved without code still gets a blob and reads back empty code"""
+        submission = Submission(
+            assignment=self.assignment,
+            student=self.student,
+            score=0.0,
+            results={}
+        )
+        submission.save()
+
+        self.assertTrue(SubmissionBlob.objects.filter(submission=submission).exists())
+        self.assertEqual(Submission.objects.get(pk=submission.id).code, '')
@@ -70,7 +70,8 @@ class PublishAssignmentView(APIView):
 @extend_schema(
     tags=['assignments'],
     parameters=[
-        OpenApiParameter(name='is_draft', description='Filter assignments by draft status', required=False, type=bool)
+        OpenApiParameter(name='is_draft', description='Filter assignments by draft status', required=False, type=bool),
+        OpenApiParameter(name='language_id', description='Filter assignments by programming language id', required=False, type=int)
     ]
 )
 class AssignmentListView(generics.ListAPIView):
@@ -130,7 +131,7 @@ class SubmissionDetailView(generics.RetrieveAPIView):
     This view allows users to view the details of a submission made for an assignment
     """
     serializer_class = SubmissionDetailSerializer
-    queryset = Submission.objects.all()
+    queryset = Submission.objects.select_related('blob')
     lookup_field = 'pk'
 
 
@@ -210,7 +211,7 @@ class AssignmentResultData(generics.ListAPIView):
     serializer_class = AssignmentResultDataSerializer
 
     def get_queryset(self):
-        return Submission.objects.filter(assignment=self.kwargs['pk'], is_best=True)
+        return Submission.objects.filter(assignment=self.kwargs['pk'], is_best=True).select_related('blob')
 
 
 class FeedbackGenerationView(APIView):
@@ -233,7 +234,7 @@ class FeedbackGenerationView(APIView):
             return Response({ 'feedback': cache.get(f'feedback_{pk}') }, status=status.HTTP_200_OK)
 
         student_name = request.user.first_name
-        submission = get_object_or_404(Submission, pk=pk)
+        submission = get_object_or_404(Submission.objects.select_related('blob'), pk=pk)
         assignment = submission.assignment
         prompt = f"""
         Role: Programming Assistant providing constructive student code feedback
@@ -298,7 +299,7 @@ class FeedbackListView(generics.ListAPIView):
     This view lists all the feedbacks for analysis purposes
     """
     serializer_class = FeedbackListSerializer
-    queryset = Feedback.objects.all()
+    queryset = Feedback.objects.select_related('submission')
 
 
 class RetrieveProgrammingLanguages(generics.ListAPIView):
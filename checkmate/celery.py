@@ -0,0 +1,10 @@
+import os
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'checkmate.settings')
+
+app = Celery('checkmate')
+
+# Read all CELERY_* prefixed settings from the django settings module
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
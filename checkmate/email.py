@@ -0,0 +1,148 @@
+from django.conf import settings
+from django.core.mail.backends import smtp
+import queue, smtplib, threading
+
+
+class _ConnectionPool:
+    """Open SMTP connections for a single server and login"""
+
+    def __init__(self):
+        self.connections = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.open_connections = 0
+
+
+class PooledSMTPBackend(smtp.EmailBackend):
+    """
+    SMTP email backend that keeps a pool of open connections per process.
+
+    Opening the backend checks out a warm connection from the pool instead of
+    doing a fresh TLS handshake and login, and closing it hands the connection
+    back. Each server and login gets its own pool of at most EMAIL_POOL_SIZE
+    connections, and a connection is retired after EMAIL_MAX_MESSAGES_PER_CONN
+    messages so that long lived sessions don't run into the provider's per
+    connection limits. When every connection is checked out, open() waits up to
+    EMAIL_POOL_WAIT_TIMEOUT seconds for one to be returned.
+    """
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, *args, pool_size=None, max_messages=None, pool_wait_timeout=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size or getattr(settings, 'EMAIL_POOL_SIZE', 5)
+        self.max_messages = max_messages or getattr(settings, 'EMAIL_MAX_MESSAGES_PER_CONN', 100)
+        self.pool_wait_timeout = (
+            pool_wait_timeout if pool_wait_timeout is not None
+            else getattr(settings, 'EMAIL_POOL_WAIT_TIMEOUT', 10)
+        )
+        self.sent_count = 0
+        self.pool = self._get_pool()
+
+    def _get_pool(self) -> _ConnectionPool:
+        """Return the pool shared by backends that talk to the same server with the same login"""
+        key = (self.host, self.port, self.username, self.use_tls, self.use_ssl)
+        with self._pools_lock:
+            if key not in self._pools:
+                self._pools[key] = _ConnectionPool()
+            return self._pools[key]
+
+    def open(self):
+        if self.connection:
+            return False
+
+        while True:
+            try:
+                connection, sent_count = self.pool.connections.get_nowait()
+            except queue.Empty:
+                if self._reserve_connection():
+                    return self._open_new_connection()
+                try:
+                    connection, sent_count = self.pool.connections.get(timeout=self.pool_wait_timeout)
+                except queue.Empty:
+                    if not self.fail_silently:
+                        raise smtplib.SMTPException('No SMTP connection available in the pool')
+                    return None
+
+            # connections can be dropped by the server while sitting in the pool
+            if self._is_alive(connection):
+                self.connection, self.sent_count = connection, sent_count
+                return True
+            self._discard(connection)
+
+    def close(self):
+        if self.connection is None:
+            return
+
+        connection, self.connection = self.connection, None
+        if self.sent_count >= self.max_messages:
+            self._discard(connection)
+        else:
+            self.pool.connections.put((connection, self.sent_count))
+
+    def _send(self, email_message):
+        # the previous message may have retired the connection this backend held
+        if self.connection is None:
+            self.open()
+            if self.connection is None:
+                return False
+
+        sent = super()._send(email_message)
+        if sent:
+            self.sent_count += 1
+            if self.sent_count >= self.max_messages:
+                connection, self.connection = self.connection, None
+                self._discard(connection)
+        return sent
+
+    def _open_new_connection(self):
+        """Open a brand new SMTP connection in the slot reserved for it"""
+        try:
+            opened = super().open()
+        except Exception:
+            self._abandon_new_connection()
+            raise
+
+        if not opened:
+            # super().open() swallows the error when fail_silently is set, but
+            # can leave behind a connection that never finished logging in
+            self._abandon_new_connection()
+            return None
+
+        self.sent_count = 0
+        return True
+
+    def _abandon_new_connection(self) -> None:
+        """Drop a connection that failed while opening and free up its slot in the pool"""
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except OSError:
+                pass
+        self._release_connection()
+
+    def _reserve_connection(self) -> bool:
+        with self.pool.lock:
+            if self.pool.open_connections >= self.pool_size:
+                return False
+            self.pool.open_connections += 1
+            return True
+
+    def _release_connection(self) -> None:
+        with self.pool.lock:
+            self.pool.open_connections -= 1
+
+    def _is_alive(self, connection) -> bool:
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _discard(self, connection) -> None:
+        """Close a connection for good and free up its slot in the pool"""
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+        finally:
+            self._release_connection()
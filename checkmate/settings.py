@@ -33,6 +33,9 @@ RAPIDAPI_HOST = env('X_RAPIDAPI_HOST')
 # Gemini API key
 GEMINI_API_KEY = env('GEMINI_API_KEY')
 
+# Frontend url used to build links sent in emails
+CLIENT_URL = env('CLIENT_URL')
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
 
@@ -110,10 +113,22 @@ DATABASES = {
         'USER': env('DB_USER'),
         'PASSWORD': env('DB_PASSWORD'),
         'HOST': env('DB_HOST'),
-        'PORT': env('DB_PORT')
+        'PORT': env('DB_PORT'),
+        # keep connections open between requests instead of reconnecting every time
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
+        # server side cursors don't work behind pgbouncer in transaction pooling mode
+        'DISABLE_SERVER_SIDE_CURSORS': env.bool('DB_DISABLE_SERVER_SIDE_CURSORS', default=False),
     }
 }
 
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # let readers and the writer work concurrently and wait on locks instead of failing
+    DATABASES['default']['OPTIONS'] = {
+        'init_command': 'PRAGMA journal_mode=WAL;',
+        'timeout': 20,
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -192,6 +207,10 @@ SPECTACULAR_SETTINGS = {
 AUTH_USER_MODEL = 'account.CustomUser'
 
 # Email Configuration
+EMAIL_BACKEND = 'checkmate.email.PooledSMTPBackend'
+EMAIL_POOL_SIZE = env.int('EMAIL_POOL_SIZE', default=5)
+EMAIL_MAX_MESSAGES_PER_CONN = env.int('EMAIL_MAX_MESSAGES_PER_CONN', default=100)
+EMAIL_POOL_WAIT_TIMEOUT = env.int('EMAIL_POOL_WAIT_TIMEOUT', default=10)
 EMAIL_HOST = env('EMAIL_HOST')
 EMAIL_HOST_USER = env('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
@@ -256,6 +275,16 @@ CACHES = {
 
 CACHE_TTL = 60 * 15
 
+# Celery configuration
+CELERY_BROKER_URL = env('CELERY_BROKER_URL', default='redis://localhost:6379/1')
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_TASK_ROUTES = {
+    # keep slow SMTP traffic on its own queue so it doesn't starve other workers
+    'account.tasks.send_email_task': {'queue': 'email_queue'},
+    'account.tasks.send_email_batch_task': {'queue': 'email_queue'},
+}
+
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -0,0 +1,127 @@
+from django.test import SimpleTestCase
+from django.core.mail import EmailMessage
+from unittest.mock import MagicMock, patch
+from .email import PooledSMTPBackend
+import smtplib
+
+
+class PooledSMTPBackendTests(SimpleTestCase):
+    """
+    Test suite for the pooled SMTP email backend
+    """
+
+    def setUp(self):
+        self.connections = []
+        self.failing_logins = set()
+
+        pools = patch.dict(PooledSMTPBackend._pools, clear=True)
+        pools.start()
+        self.addCleanup(pools.stop)
+
+        smtp = patch('smtplib.SMTP', side_effect=self._new_smtp_connection)
+        smtp.start()
+        self.addCleanup(smtp.stop)
+
+    def _new_smtp_connection(self, *args, **kwargs):
+        connection = MagicMock()
+        connection.noop.return_value = (250, b'OK')
+        # fail the login of the nth connection opened, counting from 1
+        if len(self.connections) + 1 in self.failing_logins:
+            connection.login.side_effect = smtplib.SMTPAuthenticationError(535, b'Authentication failed')
+        self.connections.append(connection)
+        return connection
+
+    def _backend(self, **kwargs):
+        return PooledSMTPBackend(host='smtp.example.com', port=587, username='user', password='pass', **kwargs)
+
+    def _message(self):
+        return EmailMessage(subject='subject', body='body', from_email='noreply@checkmate.com', to=['john@example.com'])
+
+    def test_returned_connection_is_reused(self):
+        """Ensure a connection handed back to the pool is checked out again instead of opening a new one"""
+        first = self._backend()
+        first.open()
+        connection = first.connection
+        first.close()
+
+        second = self._backend()
+        second.open()
+
+        self.assertIs(second.connection, connection)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_connection_is_retired_after_max_messages(self):
+        """Ensure a checked out connection is replaced once it has sent max_messages emails"""
+        backend = self._backend(max_messages=3)
+        backend.send_messages([self._message() for _ in range(10)])
+
+        self.assertEqual(len(self.connections), 4)
+        self.assertEqual([connection.sendmail.call_count for connection in self.connections], [3, 3, 3, 1])
+        for connection in self.connections[:3]:
+            connection.quit.assert_called_once()
+        self.assertEqual(backend.pool.open_connections, 1)
+
+    def test_dead_connection_is_discarded(self):
+        """Ensure a pooled connection that fails NOOP is closed and its slot released"""
+        first = self._backend(pool_size=1)
+        first.open()
+        dead_connection = first.connection
+        first.close()
+        dead_connection.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        second = self._backend(pool_size=1)
+        second.open()
+
+        self.assertIsNot(second.connection, dead_connection)
+        dead_connection.quit.assert_called_once()
+        self.assertEqual(second.pool.open_connections, 1)
+
+    def test_open_fails_when_pool_is_full(self):
+        """Ensure opening a backend gives up with an SMTPException when every connection is checked out"""
+        first = self._backend(pool_size=1, pool_wait_timeout=0.1)
+        first.open()
+
+        second = self._backend(pool_size=1, pool_wait_timeout=0.1)
+        with self.assertRaises(smtplib.SMTPException):
+            second.open()
+        self.assertIsNone(second.connection)
+
+    def test_pools_are_kept_per_server(self):
+        """Ensure backends for different servers or logins never share connections"""
+        backend = self._backend()
+        other_backend = PooledSMTPBackend(host='smtp.other.com', port=587, username='user', password='pass')
+
+        self.assertIsNot(backend.pool, other_backend.pool)
+
+
+    def test_failed_login_releases_its_slot(self):
+        """Ensure a connection that fails to log in mid batch is dropped and only releases its slot once"""
+        self.failing_logins = {2}
+        backend = self._backend(max_messages=1, pool_size=1)
+
+        with self.assertRaises(smtplib.SMTPAuthenticationError):
+            backend.send_messages([self._message(), self._message()])
+
+        self.assertIsNone(backend.connection)
+        self.assertEqual(backend.pool.open_connections, 0)
+        self.connections[1].close.assert_called_once()
+
+    def test_failed_login_is_not_used_when_failing_silently(self):
+        """Ensure a connection that never logged in is not used to send when fail_silently is set"""
+        self.failing_logins = {2}
+        backend = self._backend(max_messages=1, pool_size=1, fail_silently=True)
+
+        sent = backend.send_messages([self._message(), self._message()])
+
+        self.assertEqual(sent, 1)
+        self.connections[1].sendmail.assert_not_called()
+        self.assertEqual(backend.pool.open_connections, 0)
+
+    def test_full_pool_returns_none_when_failing_silently(self):
+        """Ensure opening a full pool gives up quietly when fail_silently is set"""
+        self._backend(pool_size=1).open()
+
+        backend = self._backend(pool_size=1, pool_wait_timeout=0.1, fail_silently=True)
+
+        self.assertIsNone(backend.open())
+        self.assertIsNone(backend.connection)